@@ -76,6 +76,22 @@ class CrawlConferencePapers:
             for paper in papers_by_doi.get(fetched.doi, []):
                 paper.apply_enrichment(fetched.enrichment, overwrite=overwrite)
 
+    def _select_enrichment_targets(self, papers: list[Paper]) -> list[Paper]:
+        """補完対象とする論文を選択します。
+
+        上書きしない設定の場合、要約と PDF URL が既に揃っている論文は補完しても
+        変化しないため、外部 API への問い合わせ対象から除外します。
+
+        Args:
+            papers: 補完候補の論文リスト。
+
+        Returns:
+            補完対象の論文リスト。
+        """
+        if self.overwrite_enrichments:
+            return papers
+        return [p for p in papers if p.abstract is None or p.pdf_url is None]
+
     async def execute(self, year: int) -> list[Paper]:
         """指定された学会の指定年度の論文を取得・補完・保存します。
 
@@ -84,7 +100,7 @@ class CrawlConferencePapers:
             1. **取得フェーズ**: paper_retriever から指定年度の論文一覧を取得
             2. **フィルタリング**: DOI が存在しない論文を除外
             3. **補完フェーズ**: paper_enrichers リスト内の各リポジトリで
-               段階的に論文情報を補完
+               段階的に論文情報を補完（上書きしない場合、補完済みの論文は対象外）
             4. **保存フェーズ**: 補完済み論文をデータレイクに保存
 
         Args:
@@ -112,8 +128,18 @@ class CrawlConferencePapers:
         )
         for paper_enricher in self.paper_enrichers:
             enricher_name = paper_enricher.__class__.__name__
-            logger.info(f"Enriching {self.conf_name.upper()} {year} papers with {enricher_name}...")
-            fetched_enrichments = await paper_enricher.fetch_enrichments(papers)
+            target_papers = self._select_enrichment_targets(papers)
+            if not target_papers:
+                logger.info(
+                    f"All {self.conf_name.upper()} {year} papers are already enriched. "
+                    f"Skipping {enricher_name}."
+                )
+                continue
+            logger.info(
+                f"Enriching {len(target_papers)} {self.conf_name.upper()} {year} papers "
+                f"with {enricher_name}..."
+            )
+            fetched_enrichments = await paper_enricher.fetch_enrichments(target_papers)
             self._apply_enrichments(
                 papers,
                 fetched_enrichments,
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 from pydantic import BaseModel
 
 
@@ -59,3 +61,23 @@ class FetchedPaperEnrichment(BaseModel):
 
     doi: str
     enrichment: PaperEnrichment
+
+
+def unique_papers_by_doi(papers: Iterable[Paper]) -> dict[str, Paper]:
+    """DOI ごとに最初に現れた論文を、出現順を保って返します。
+
+    補完結果は DOI 単位で適用されるため、同じ DOI を複数回問い合わせないよう
+    補完リポジトリが問い合わせ前に使用します。DOI のない論文は補完結果を
+    紐付けられないため除外します。
+
+    Args:
+        papers: 論文のイテラブル。
+
+    Returns:
+        DOI をキー、その DOI を持つ最初の論文を値とする辞書。
+    """
+    by_doi: dict[str, Paper] = {}
+    for paper in papers:
+        if paper.doi:
+            by_doi.setdefault(paper.doi, paper)
+    return by_doi
@@ -9,7 +9,7 @@ def create_http_client(
     timeout: float = 30.0,
     max_connections: int = 100,
     max_keepalive_connections: int = 20,
-    keepalive_expiry: float = 5.0,
+    keepalive_expiry: float = 30.0,
 ) -> httpx.AsyncClient:
     """Create a configured httpx.AsyncClient instance.
 
@@ -19,7 +19,9 @@ def create_http_client(
         timeout: Request timeout in seconds
         max_connections: Maximum number of concurrent connections
         max_keepalive_connections: Maximum number of keep-alive connections
-        keepalive_expiry: Keep-alive expiry time in seconds
+        keepalive_expiry: Keep-alive expiry time in seconds. Kept longer than the
+            slowest per-host rate limit (arXiv: 1 request / 5s) so idle connections
+            survive between rate-limited requests
 
     Returns:
         Configured AsyncClient instance
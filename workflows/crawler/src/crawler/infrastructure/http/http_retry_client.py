@@ -1,7 +1,7 @@
 """リトライポリシー付き HTTP クライアントモジュール。"""
 
 import asyncio
-from contextlib import AsyncExitStack
+from contextlib import nullcontext
 from typing import Any, Literal, TypeAlias
 
 import httpx
@@ -97,12 +97,10 @@ class HttpRetryClient:
             httpx.HTTPStatusError: 4xx/5xx かつ retry_statuses 対象外のステータスコードの場合。
             httpx.RequestError: ネットワークレベルのエラー。
         """
-        async with AsyncExitStack() as stack:
-            if self._semaphore:
-                await stack.enter_async_context(self._semaphore)
-            if self._limiter:
-                await stack.enter_async_context(self._limiter)
-            logger.debug(f"In Semaphore and Limiter, {method} request to URL: {url}")
+        # 未設定の制御は nullcontext で置き換え、リクエストごとに AsyncExitStack を
+        # 生成せずに 1 つの async with で semaphore と limiter を取得する
+        async with self._semaphore or nullcontext(), self._limiter or nullcontext():
+            logger.debug("In Semaphore and Limiter, {} request to URL: {}", method, url)
             match method:
                 case "GET":
                     response = await self._client.get(
@@ -146,8 +144,15 @@ class HttpRetryClient:
             json: リクエストボディ。
             headers: 追加リクエストヘッダー。
         """
+        # f-string だと DEBUG 無効時にも params / json（数百件の DOI を含みうる）の
+        # 文字列化が毎回走るため、loguru の遅延フォーマットに任せる
         logger.debug(
-            f"Starting {method} request to URL: {url}, params: {params}, json: {json}, headers: {headers}"
+            "Starting {} request to URL: {}, params: {}, json: {}, headers: {}",
+            method,
+            url,
+            params,
+            json,
+            headers,
         )
         res = await self._request_with_retry(
             method,
@@ -157,7 +162,12 @@ class HttpRetryClient:
             headers=headers,
         )
         logger.debug(
-            f"Finished {method} request to URL: {url}, params: {params}, json: {json}, headers: {headers}"
+            "Finished {} request to URL: {}, params: {}, json: {}, headers: {}",
+            method,
+            url,
+            params,
+            json,
+            headers,
         )
         return res
 
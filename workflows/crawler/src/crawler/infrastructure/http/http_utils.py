@@ -3,7 +3,10 @@
 リトライ処理で共通利用されるヘルパー関数を提供します。
 """
 
+import math
 from collections.abc import Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import NoReturn
 
 import httpx
@@ -13,6 +16,10 @@ from tenacity import (
     wait_random_exponential,
 )
 
+# 不正・悪意のある Retry-After でタスクが事実上停止しないよう、待機秒数の上限を設ける。
+# 正当なサーバー指定（数分程度）を切り詰めないよう、十分に大きな値にしている
+MAX_RETRY_AFTER_SECONDS = 3600.0
+
 
 def log_and_raise_final_error(retry_state: RetryCallState) -> NoReturn:
     """リトライ回数超過時にエラーログを出力し、例外を送出します。
@@ -80,12 +87,49 @@ def before_log(retry_state: RetryCallState) -> None:
     )
 
 
+def parse_retry_after(value: str) -> float | None:
+    """Retry-After ヘッダーの値を待機秒数に変換します。
+
+    秒数形式（例: ``"120"``）と HTTP-date 形式
+    （例: ``"Wed, 21 Oct 2015 07:28:00 GMT"``）の両方に対応します。
+    過去の日時や負数は 0 秒とし、``MAX_RETRY_AFTER_SECONDS`` を超える値は上限に
+    切り詰めて WARNING を出力します。
+
+    Args:
+        value: Retry-After ヘッダーの値。
+
+    Returns:
+        待機秒数。解釈できない値や有限でない値（``inf``, ``nan``）の場合は None。
+    """
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(tz=timezone.utc)).total_seconds()
+
+    if not math.isfinite(seconds):
+        return None
+    if seconds > MAX_RETRY_AFTER_SECONDS:
+        logger.warning(
+            "Retry-After {} exceeds the cap; waiting {}s instead", value, MAX_RETRY_AFTER_SECONDS
+        )
+        return MAX_RETRY_AFTER_SECONDS
+    return max(seconds, 0.0)
+
+
 def make_wait_retry_after(retry_statuses: frozenset[int]) -> Callable[[RetryCallState], float]:
     """retry_statuses に連動した wait 関数を返すファクトリ。
 
-    対象ステータスかつ Retry-After ヘッダーがあればその値を使い、
+    対象ステータスかつ Retry-After ヘッダーがあればその値（秒数または HTTP-date）を使い、
     なければ指数バックオフにフォールバックする。
     """
+    # フォールバック用の wait 戦略はリトライのたびに生成せず、ここで一度だけ構築する
+    default_wait = wait_random_exponential(multiplier=1, min=1, max=10)
 
     def wait_retry_after(retry_state: RetryCallState) -> float:
         if retry_state.outcome is not None and retry_state.outcome.exception() is None:
@@ -93,13 +137,12 @@ def make_wait_retry_after(retry_statuses: frozenset[int]) -> Callable[[RetryCall
             if isinstance(result, httpx.Response) and result.status_code in retry_statuses:
                 retry_after = result.headers.get("Retry-After")
                 if retry_after:
-                    try:
-                        wait_time = float(retry_after)
-                        logger.debug(f"Waiting for {wait_time}s (Retry-After)")
+                    wait_time = parse_retry_after(retry_after)
+                    if wait_time is not None:
+                        logger.debug("Waiting for {}s (Retry-After)", wait_time)
                         return wait_time
-                    except ValueError:
-                        logger.warning(f"Invalid Retry-After header: {retry_after}")
+                    logger.warning("Invalid Retry-After header: {}", retry_after)
 
-        return wait_random_exponential(multiplier=1, min=1, max=10)(retry_state)
+        return default_wait(retry_state)
 
     return wait_retry_after
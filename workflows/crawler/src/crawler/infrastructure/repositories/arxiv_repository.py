@@ -8,8 +8,14 @@ import httpx
 from aiolimiter import AsyncLimiter
 from loguru import logger
 
-from crawler.domain.models.paper import FetchedPaperEnrichment, Paper, PaperEnrichment
+from crawler.domain.models.paper import (
+    FetchedPaperEnrichment,
+    Paper,
+    PaperEnrichment,
+    unique_papers_by_doi,
+)
 from crawler.infrastructure.http.http_retry_client import HttpRetryClient
+from crawler.utils.concurrency import run_bounded
 
 
 class ArxivXMLParseError(Exception):
@@ -26,8 +32,14 @@ class ArxivRepository:
         "opensearch": "http://a9.com/-/spec/opensearch/1.1/",
         "arxiv": "http://arxiv.org/schemas/atom",
     }
+    # find() のたびに名前空間プレフィックスを解決しないよう、完全修飾タグを事前に組み立てる
+    _ATOM = "{" + NAMESPACES["atom"] + "}"
+    _TAG_ENTRY = f"{_ATOM}entry"
+    _TAG_SUMMARY = f"{_ATOM}summary"
+    _PATH_PDF_LINK = f"{_ATOM}link[@title='pdf']"
 
     DEFAULT_SLEEP_SECONDS = 5
+    DEFAULT_CONCURRENCY = 1
 
     def __init__(self, http: HttpRetryClient) -> None:
         """ArxivRepositoryインスタンスを初期化します。
@@ -57,7 +69,7 @@ class ArxivRepository:
             client=client,
             max_retry_count=max_retry_count,
             limiter=AsyncLimiter(1, cls.DEFAULT_SLEEP_SECONDS),
-            semaphore=asyncio.Semaphore(1),
+            semaphore=asyncio.Semaphore(cls.DEFAULT_CONCURRENCY),
         )
         return cls(http=http_client)
 
@@ -65,7 +77,7 @@ class ArxivRepository:
         """論文リストにarXivの補完情報を付与します。
 
         DOI検索を試し、失敗した場合はタイトル検索を試みます。
-        並列タスク数を抑制するため、BATCH_SIZE 件ずつ処理します。
+        同時実行数と同数のワーカーがキューから論文を取り出して順に処理します。
 
         Args:
             papers: 更新対象の論文リスト。
@@ -73,26 +85,15 @@ class ArxivRepository:
         Returns:
             論文識別子と補完情報の取得結果リスト。
         """
-        # arXiv は 1 リクエスト / 5 秒のレート制限があり、全件を一括で TaskGroup に
-        # 投入するとタスクオブジェクトがメモリを圧迫しスケジューリングコストも増大する。
-        # BATCH_SIZE 件ずつ TaskGroup を区切ることで同時生成タスク数を抑制しつつ、
-        # 内側の limiter / semaphore によるレート制限は引き続き有効に機能する。
-        BATCH_SIZE = 50
-        enrichments: list[FetchedPaperEnrichment] = []
-        for i in range(0, len(papers), BATCH_SIZE):
-            batch = papers[i : i + BATCH_SIZE]
-            tasks: list[asyncio.Task[FetchedPaperEnrichment | None]] = []
-            async with asyncio.TaskGroup() as tg:
-                for paper in batch:
-                    tasks.append(tg.create_task(self._fetch_single_paper_enrichment(paper)))
-            for task in tasks:
-                result = task.result()
-                if result is not None:
-                    enrichments.append(result)
-            logger.debug(
-                f"arXiv enrichment progress: {min(i + BATCH_SIZE, len(papers))}/{len(papers)}"
-            )
-        return enrichments
+        # arXiv は 1 リクエスト / 5 秒のレート制限があるため、論文ごとにタスクを生成せず
+        # 同時実行数と同数のワーカーで消化する。
+        results = await run_bounded(
+            self._fetch_single_paper_enrichment,
+            unique_papers_by_doi(papers).values(),
+            concurrency=self.DEFAULT_CONCURRENCY,
+            progress_label="arXiv enrichment",
+        )
+        return [result for result in results if result is not None]
 
     async def _fetch_single_paper_enrichment(self, paper: Paper) -> FetchedPaperEnrichment | None:
         """単一の論文に対する arXiv 補完情報を取得します。
@@ -185,7 +186,9 @@ class ArxivRepository:
             return None
 
         try:
-            return self._parse_xml(resp.text)
+            # XML 宣言のエンコーディングでパーサーに直接デコードさせ、resp.text による
+            # 文字コード判定と str への変換を省く
+            return self._parse_xml(resp.content)
         except ArxivXMLParseError as e:
             logger.warning(
                 "arXiv XML parse error: query={query} context={ctx} error={error}",
@@ -205,11 +208,11 @@ class ArxivRepository:
             )
             return None
 
-    def _parse_xml(self, xml_text: str) -> PaperEnrichment | None:
+    def _parse_xml(self, xml_text: str | bytes) -> PaperEnrichment | None:
         """arXiv API レスポンスから PaperEnrichment を生成します。
 
         Args:
-            xml_text: arXiv API から返された Atom 形式の XML 文字列。
+            xml_text: arXiv API から返された Atom 形式の XML（文字列またはバイト列）。
 
         Returns:
             パースされた PaperEnrichment オブジェクト。エントリが存在しない場合は None。
@@ -222,22 +225,19 @@ class ArxivRepository:
         except (StdParseError, Exception) as e:
             raise ArxivXMLParseError(f"Failed to parse arXiv XML response: {e}") from e
 
-        entry = root.find("atom:entry", self.NAMESPACES)
+        entry = root.find(self._TAG_ENTRY)
         if entry is None:
             return None
 
         # 要約
-        summary_tag = entry.find("atom:summary", self.NAMESPACES)
+        summary_tag = entry.find(self._TAG_SUMMARY)
         summary = None
         if summary_tag is not None and summary_tag.text:
             summary = summary_tag.text.strip()
 
         # PDFリンク
-        pdf_url = None
-        for link in entry.findall("atom:link", self.NAMESPACES):
-            if link.attrib.get("title") == "pdf":
-                pdf_url = link.attrib.get("href")
-                break
+        pdf_link = entry.find(self._PATH_PDF_LINK)
+        pdf_url = pdf_link.attrib.get("href") if pdf_link is not None else None
 
         return PaperEnrichment(
             abstract=summary,
@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import Sequence
 from typing import Any
 
 import httpx
@@ -51,7 +52,10 @@ class DBLPRepository:
         """リポジトリの初期化処理を実行します。
 
         robots.txt をロードします。この関数は使用前に一度呼び出す必要があります。
+        ロード済みの場合は robots.txt を再取得しません。
         """
+        if self.robot_guard.loaded:
+            return
         await self.robot_guard.load(client=client)
 
     async def fetch_papers(
@@ -120,13 +124,12 @@ class DBLPRepository:
                 logger.info("No papers found matching the criteria.")
                 return []
 
-            hits = hits_container.get("hit", [])
-            papers = []
-            for hit in hits:
-                paper = self._parse_single_paper(hit)
-                if paper:
-                    papers.append(paper)
-            return papers
+            hits = hits_container.get("hit") or []
+            # XML 由来の JSON のため、ヒットが 1 件のときは hit がリストではなく辞書になる
+            if type(hits) is dict:
+                hits = [hits]
+            parse_single_paper = self._parse_single_paper
+            return [paper for hit in hits if (paper := parse_single_paper(hit)) is not None]
         except (KeyError, ValueError, TypeError) as e:
             logger.error(f"Failed to parse DBLP response: {e}")
             return []
@@ -142,32 +145,30 @@ class DBLPRepository:
         """
         try:
             info = hit["info"]
+            get = info.get
 
-            # 必須フィールドの検証
-            title = info.get("title")
+            # 必須フィールドの検証（著者のパースより先に行い、不正な hit では無駄に処理しない）
+            title = get("title")
             if not title:
                 return None
 
-            authors_data = info.get("authors")
-            authors = self._parse_authors(authors_data)
-
-            year_str = info.get("year")
+            year_str = get("year")
             if not year_str:
                 return None
             year = int(year_str)
 
-            venue = info.get("venue")
+            venue = get("venue")
             if not venue:
                 return None
 
             return Paper(
                 title=title,
-                authors=authors,
+                authors=self._parse_authors(get("authors")),
                 year=year,
                 venue=venue,
-                doi=info.get("doi"),
-                type=info.get("type"),
-                ee=info.get("ee"),
+                doi=get("doi"),
+                type=get("type"),
+                ee=get("ee"),
             )
         except Exception as e:
             logger.warning(f"Failed to parse single paper from DBLP hit: {hit}. Error: {e}")
@@ -182,25 +183,21 @@ class DBLPRepository:
         Returns:
             著者名の文字列リスト。
         """
-        if not authors_data:
+        # authors要素は辞書（{"author": ...}）の場合のみ著者を含む。
+        # 著者数 × 論文数だけ呼ばれるため、isinstance ではなく type の同一性で判定する。
+        if type(authors_data) is not dict:
             return []
 
-        # authors要素自体が辞書の場合（{"author": ...}）
-        if isinstance(authors_data, dict):
-            inner_author = authors_data.get("author")
-            if not inner_author:
-                return []
+        # authorはリストまたは単一の辞書（著者が 1 人の場合）。どちらも同じ内包表記で処理する
+        inner_author: Any = authors_data.get("author")
+        inner_type = type(inner_author)
+        items: Sequence[Any]
+        if inner_type is dict:
+            items = (inner_author,)
+        elif inner_type is list:
+            items = inner_author
+        else:
+            return []
 
-            # authorがリストの場合
-            if isinstance(inner_author, list):
-                return [
-                    str(a.get("text"))
-                    for a in inner_author
-                    if isinstance(a, dict) and a.get("text")
-                ]
-            # authorが単一の辞書の場合
-            elif isinstance(inner_author, dict):
-                text = inner_author.get("text")
-                return [text] if text else []
-
-        return []
+        # 数値のみの著者名などが数値でデコードされても、論文ごと破棄されないよう文字列化する
+        return [str(a["text"]) for a in items if type(a) is dict and a.get("text")]
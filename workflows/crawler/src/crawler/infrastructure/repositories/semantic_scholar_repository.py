@@ -7,7 +7,12 @@ import httpx
 from aiolimiter import AsyncLimiter
 from loguru import logger
 
-from crawler.domain.models.paper import FetchedPaperEnrichment, Paper, PaperEnrichment
+from crawler.domain.models.paper import (
+    FetchedPaperEnrichment,
+    Paper,
+    PaperEnrichment,
+    unique_papers_by_doi,
+)
 from crawler.infrastructure.http.http_retry_client import HttpRetryClient
 
 
@@ -16,9 +21,12 @@ class SemanticScholarRepository:
 
     # Semantic Scholar APIは最大500件までバッチで取得可能
     BATCH_SIZE = 500
-    FIELDS = "externalIds,abstract,openAccessPdf,title,year,venue,authors,url"
+    # 補完に使うフィールドのみ要求し、レスポンスサイズとパースコストを抑える
+    FIELDS = "externalIds,abstract,openAccessPdf"
     BASE_URL = "https://api.semanticscholar.org"
     PAPER_BATCH_SEARCH_PATH = "graph/v1/paper/batch"
+    # バッチごとに URL を組み立てないよう、クラス定義時に 1 度だけ生成する
+    _BATCH_URL = f"{BASE_URL}/{PAPER_BATCH_SEARCH_PATH}"
     DEFAULT_SLEEP_SECONDS = 0.1
     DEFAULT_CONCURRENCY = 5
 
@@ -29,6 +37,8 @@ class SemanticScholarRepository:
             http: HTTPリクエストに使用するHttpRetryClientインスタンス。
         """
         self.http = http
+        # 可変な dict をクラス属性で共有しないよう、クエリパラメータはインスタンスごとに生成する
+        self._batch_params: dict[str, Any] = {"fields": self.FIELDS}
 
     @classmethod
     def from_client(
@@ -54,10 +64,10 @@ class SemanticScholarRepository:
         return cls(http=http_client)
 
     async def fetch_enrichments(self, papers: list[Paper]) -> list[FetchedPaperEnrichment]:
-        doi_map = {p.doi: p for p in papers if p.doi}
-        if not doi_map:
+        dois = list(unique_papers_by_doi(papers))
+        if not dois:
             return []
-        return await self.fetch_papers_batch(list(doi_map))
+        return await self.fetch_papers_batch(dois)
 
     async def fetch_papers_batch(self, dois: list[str]) -> list[FetchedPaperEnrichment]:
         """Semantic Scholar APIからバッチで論文補完情報を取得します。
@@ -96,23 +106,17 @@ class SemanticScholarRepository:
         """
         try:
             payload = {"ids": [f"DOI:{doi}" for doi in batch_dois]}
-            params = {"fields": self.FIELDS}
-            resp = await self.http.post(
-                f"{self.BASE_URL}/{self.PAPER_BATCH_SEARCH_PATH}",
-                params=params,
-                json=payload,
-            )
+            resp = await self.http.post(self._BATCH_URL, params=self._batch_params, json=payload)
             # raise_for_status() は不要 — HttpRetryClient が非リトライエラーで既に上げる
             data = resp.json()
 
-            # レスポンスのパース
-            enrichments = []
-            for item in data:
-                if item:  # item自体がNoneの場合がある（API仕様）
-                    fetched = self._parse_single_paper(item)
-                    if fetched:
-                        enrichments.append(fetched)
-            return enrichments
+            # レスポンスのパース（item自体がNoneの場合がある（API仕様））
+            parse_single_paper = self._parse_single_paper
+            return [
+                fetched
+                for item in data
+                if item and (fetched := parse_single_paper(item)) is not None
+            ]
 
         except httpx.HTTPStatusError as e:
             # 404 Not Foundは論文が存在しないケースとして扱う
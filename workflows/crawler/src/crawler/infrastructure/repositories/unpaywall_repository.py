@@ -5,8 +5,14 @@ import httpx
 from aiolimiter import AsyncLimiter
 from loguru import logger
 
-from crawler.domain.models.paper import FetchedPaperEnrichment, Paper, PaperEnrichment
+from crawler.domain.models.paper import (
+    FetchedPaperEnrichment,
+    Paper,
+    PaperEnrichment,
+    unique_papers_by_doi,
+)
 from crawler.infrastructure.http.http_retry_client import HttpRetryClient
+from crawler.utils.concurrency import run_bounded
 
 
 class UnpaywallRepository:
@@ -14,6 +20,8 @@ class UnpaywallRepository:
 
     BASE_URL = "https://api.unpaywall.org"
     PAPER_SEARCH_PATH = "v2"
+    # リクエストごとの URL 組み立てを DOI の連結だけにするため、接頭辞を 1 度だけ生成する
+    _DOI_URL_PREFIX = f"{BASE_URL}/{PAPER_SEARCH_PATH}/"
     DEFAULT_SLEEP_SECONDS = 0.1
     DEFAULT_CONCURRENCY = 5
     DEFAULT_EMAIL = "crawler@haru256.dev"
@@ -55,32 +63,18 @@ class UnpaywallRepository:
 
     async def fetch_enrichments(self, papers: list[Paper]) -> list[FetchedPaperEnrichment]:
         """論文リストに対応する Unpaywall 補完情報を取得します。"""
-        # DOIを持つ論文のみ対象
-        target_papers = [p for p in papers if p.doi]
-        if not target_papers:
+        papers_by_doi = unique_papers_by_doi(papers)
+        if not papers_by_doi:
             return []
 
-        # 全件を一括で TaskGroup に投入するとタスクオブジェクトがメモリを圧迫し
-        # スケジューリングコストも増大する。BATCH_SIZE 件ずつ TaskGroup を区切ることで
-        # 同時生成タスク数を抑制しつつ、内側の limiter / semaphore によるレート制限は
-        # 引き続き有効に機能する。
-        BATCH_SIZE = 50
-        enrichments: list[FetchedPaperEnrichment] = []
-        for i in range(0, len(target_papers), BATCH_SIZE):
-            batch = target_papers[i : i + BATCH_SIZE]
-            tasks: list[asyncio.Task[FetchedPaperEnrichment | None]] = []
-            async with asyncio.TaskGroup() as tg:
-                for paper in batch:
-                    tasks.append(tg.create_task(self._fetch_single_paper_enrichment(paper)))
-            for task in tasks:
-                result = task.result()
-                if result is not None:
-                    enrichments.append(result)
-            logger.debug(
-                f"Unpaywall enrichment progress: {min(i + BATCH_SIZE, len(target_papers))}/{len(target_papers)}"
-            )
-
-        return enrichments
+        # 論文ごとにタスクを生成せず、同時実行数と同数のワーカーで消化する
+        results = await run_bounded(
+            self._fetch_single_paper_enrichment,
+            papers_by_doi.values(),
+            concurrency=self.DEFAULT_CONCURRENCY,
+            progress_label="Unpaywall enrichment",
+        )
+        return [result for result in results if result is not None]
 
     async def _fetch_single_paper_enrichment(self, paper: Paper) -> FetchedPaperEnrichment | None:
         """単一の論文に対する Unpaywall 補完情報を取得します。
@@ -95,7 +89,7 @@ class UnpaywallRepository:
 
         enrichment = await self.fetch_by_doi(paper.doi)
         if not enrichment:
-            logger.debug(f"Unpaywall: no data found for doi={paper.doi!r}")
+            logger.debug("Unpaywall: no data found for doi={doi!r}", doi=paper.doi)
             return None
 
         return FetchedPaperEnrichment(doi=paper.doi, enrichment=enrichment)
@@ -109,7 +103,7 @@ class UnpaywallRepository:
         Returns:
             取得した PDF URL などを含む PaperEnrichment オブジェクト。取得失敗時は None。
         """
-        url = f"{self.BASE_URL}/{self.PAPER_SEARCH_PATH}/{doi}"
+        url = self._DOI_URL_PREFIX + doi
 
         try:
             resp = await self.http.get(url, params={"email": self.email})
@@ -119,7 +113,7 @@ class UnpaywallRepository:
         except httpx.HTTPStatusError as e:
             # 404 Not Foundは論文が存在しないケースとして扱う
             if e.response.status_code == 404:
-                logger.debug(f"No paper found for DOI {doi} on Unpaywall (404).")
+                logger.debug("No paper found for DOI {doi} on Unpaywall (404).", doi=doi)
             else:
                 logger.warning(
                     "Unpaywall HTTP error: status={status} doi={doi} error={error}",
@@ -163,24 +157,21 @@ class UnpaywallRepository:
         if not data:
             return None
 
-        # PDF URLの取得ロジック
-        pdf_url = None
-        best_oa_location = data.get("best_oa_location")
-        if best_oa_location:
-            pdf_url = best_oa_location.get("url_for_pdf")
+        if data.get("doi") is None:
+            logger.warning(
+                "Unpaywall response is missing 'doi' field. Response data: {data}", data=data
+            )
+            return None
 
+        # PDF URLの取得ロジック
+        # best_oa_location で見つかれば oa_locations は参照しない
+        pdf_url = (data.get("best_oa_location") or {}).get("url_for_pdf")
         if not pdf_url:
-            oa_locations = data.get("oa_locations", [])
-            for loc in oa_locations:
-                url = loc.get("url_for_pdf")
-                if url:
-                    pdf_url = url
+            for loc in data.get("oa_locations") or ():
+                pdf_url = loc.get("url_for_pdf")
+                if pdf_url:
                     break
 
-        if data.get("doi") is None:
-            logger.warning(f"Unpaywall response is missing 'doi' field. Response data: {data}")
-            return None
-
         return PaperEnrichment(
-            pdf_url=pdf_url,
+            pdf_url=pdf_url or None,
         )
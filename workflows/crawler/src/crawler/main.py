@@ -85,10 +85,19 @@ async def run_crawl_task(
     if total_papers_count > 0:
         abs_pass_cnt = sum(p.abstract is not None for p in enriched_papers)
         pdf_pass_cnt = sum(p.pdf_url is not None for p in enriched_papers)
+        # f-string ではなく loguru の遅延フォーマットに任せ、INFO を出力するシンクが
+        # ない場合は文字列の組み立て自体を省略する
         logger.info(
-            f"{usecase.conf_name.upper()} {year}, Total papers: {total_papers_count}, "
-            f"Abstract pass rate: {abs_pass_cnt / total_papers_count:.4f} ({abs_pass_cnt}/{total_papers_count}), "
-            f"PDF pass rate: {pdf_pass_cnt / total_papers_count:.4f} ({pdf_pass_cnt}/{total_papers_count})"
+            "{conf} {year}, Total papers: {total}, "
+            "Abstract pass rate: {abs_rate:.4f} ({abs_cnt}/{total}), "
+            "PDF pass rate: {pdf_rate:.4f} ({pdf_cnt}/{total})",
+            conf=usecase.conf_name.upper(),
+            year=year,
+            total=total_papers_count,
+            abs_cnt=abs_pass_cnt,
+            pdf_cnt=pdf_pass_cnt,
+            abs_rate=abs_pass_cnt / total_papers_count,
+            pdf_rate=pdf_pass_cnt / total_papers_count,
         )
 
     return enriched_papers
@@ -118,6 +127,8 @@ async def main() -> None:
         enriched_papers: list[Paper] = [paper for task in tasks for paper in task.result()]
 
     logger.info(f"Total enriched papers: {len(enriched_papers)}")
+    # enqueue=True のシンクに溜まったログを終了前に出し切る
+    await logger.complete()
 
 
 if __name__ == "__main__":
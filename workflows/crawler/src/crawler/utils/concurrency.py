@@ -0,0 +1,70 @@
+"""並行処理ユーティリティモジュール。
+
+同時実行数を制限して非同期処理を実行するヘルパー関数を提供します。
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+
+from loguru import logger
+
+
+async def run_bounded[T, R](
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    concurrency: int,
+    progress_label: str | None = None,
+    progress_interval: int = 50,
+) -> list[R]:
+    """固定数のワーカーで items を消化し、各要素に func を適用した結果を返します。
+
+    要素ごとにタスクを生成すると、limiter / semaphore の待ち行列に並ぶだけの
+    タスクオブジェクトがメモリとスケジューリングコストを消費します。
+    同時実行数と同数のワーカーが asyncio.Queue から要素を取り出すことで、
+    生成するタスク数を一定に保ちます。
+
+    Args:
+        func: 各要素に適用する非同期関数。
+        items: 処理対象の要素。
+        concurrency: ワーカー数（同時実行数の上限）。
+        progress_label: 指定した場合、進捗をこのラベルで DEBUG ログに出力する。
+        progress_interval: 進捗ログを出力する処理件数の間隔。
+
+    Returns:
+        items と同じ順序で並んだ func の結果リスト。
+
+    Raises:
+        ValueError: concurrency が 1 未満の場合。
+        ExceptionGroup: func が例外を送出した場合（TaskGroup により集約される）。
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+    queue: asyncio.Queue[tuple[int, T]] = asyncio.Queue()
+    for indexed_item in enumerate(items):
+        queue.put_nowait(indexed_item)
+
+    total = queue.qsize()
+    results: dict[int, R] = {}
+    processed = 0
+
+    async def worker() -> None:
+        nonlocal processed
+        while not queue.empty():
+            index, item = queue.get_nowait()
+            results[index] = await func(item)
+            processed += 1
+            if progress_label is not None and (
+                processed % progress_interval == 0 or processed == total
+            ):
+                logger.debug(
+                    "{label} progress: {done}/{total}",
+                    label=progress_label,
+                    done=processed,
+                    total=total,
+                )
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(min(concurrency, total)):
+            tg.create_task(worker())
+    return [results[i] for i in range(total)]
@@ -8,7 +8,12 @@ def setup_logger(log_level: str = "DEBUG") -> None:
 
     デフォルトの設定をリセットし、標準エラー出力へ環境変数 ``LOG_LEVEL``
     に基づいたレベルでログを出力するよう再設定します。
+    ``enqueue=True`` により、標準エラー出力への書き込みのみを loguru のワーカースレッドへ
+    移します。フォーマットは呼び出し元のスレッドで行われ、レコードは pickle されて
+    キューに渡されるため、ログに渡す値（kwargs を含む）は pickle 可能である必要があります。
+    pickle できない値（例: ``httpx.HTTPStatusError`` インスタンス）を渡すとレコードが
+    失われるため、例外は ``repr(e)`` などの文字列にしてから渡してください。
     """
     # 一度デフォルトの設定を消してから再設定
     logger.remove()
-    logger.add(sys.stderr, level=log_level)
+    logger.add(sys.stderr, level=log_level, enqueue=True)
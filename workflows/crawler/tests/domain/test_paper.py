@@ -1,7 +1,12 @@
 import pytest
 from pydantic import ValidationError
 
-from crawler.domain.models.paper import FetchedPaperEnrichment, Paper, PaperEnrichment
+from crawler.domain.models.paper import (
+    FetchedPaperEnrichment,
+    Paper,
+    PaperEnrichment,
+    unique_papers_by_doi,
+)
 
 
 def test_paper_creation_with_all_fields() -> None:
@@ -316,3 +321,16 @@ def test_paper_inequality() -> None:
     )
 
     assert paper1 != paper2
+
+
+def test_unique_papers_by_doi() -> None:
+    """DOI ごとに最初の論文のみを出現順で残し、DOI のない論文を除外することをテスト"""
+    first = Paper(title="A", authors=[], year=2024, venue="v", doi="10.1000/a")
+    duplicate = Paper(title="A-dup", authors=[], year=2024, venue="v", doi="10.1000/a")
+    second = Paper(title="B", authors=[], year=2024, venue="v", doi="10.1000/b")
+    no_doi = Paper(title="C", authors=[], year=2024, venue="v", doi=None)
+
+    result = unique_papers_by_doi([first, no_doi, duplicate, second])
+
+    assert list(result) == ["10.1000/a", "10.1000/b"]
+    assert result["10.1000/a"] is first
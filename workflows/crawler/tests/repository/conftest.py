@@ -0,0 +1,9 @@
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def mock_client(mocker: MockerFixture) -> httpx.AsyncClient:
+    """Mock AsyncClient fixture."""
+    return mocker.AsyncMock(spec=httpx.AsyncClient)
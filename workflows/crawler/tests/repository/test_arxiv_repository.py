@@ -1,6 +1,5 @@
 import asyncio
 from typing import Any
-from unittest.mock import Mock
 
 import httpx
 import pytest
@@ -16,12 +15,6 @@ def headers() -> dict[str, str]:
     return {"User-Agent": "TestBot/1.0"}
 
 
-@pytest.fixture
-def mock_client(mocker: MockerFixture) -> httpx.AsyncClient:
-    """Mock AsyncClient fixture."""
-    return mocker.AsyncMock(spec=httpx.AsyncClient)
-
-
 def test_parse_xml_valid(mock_client: httpx.AsyncClient) -> None:
     """正常なXMLから補完情報をパースできることをテスト"""
     repo = ArxivRepository.from_client(mock_client)
@@ -46,6 +39,9 @@ def test_parse_xml_valid(mock_client: httpx.AsyncClient) -> None:
     assert paper.pdf_url == "http://arxiv.org/pdf/1706.03762v5"
     assert isinstance(paper, PaperEnrichment)
 
+    # レスポンスのバイト列をそのまま渡しても同じ結果になること
+    assert repo._parse_xml(xml.encode("utf-8")) == paper
+
 
 def test_parse_xml_no_entry(mock_client: httpx.AsyncClient) -> None:
     """エントリがない場合のパーステスト"""
@@ -85,11 +81,12 @@ def test_parse_xml_invalid_raises_parse_error(mock_client: httpx.AsyncClient) ->
 
 async def test_fetch_call_args(mock_client: httpx.AsyncClient, mocker: MockerFixture) -> None:
     """fetch_by_titleが正しく引数を渡しているか確認する"""
-    mock_response = Mock(spec=httpx.Response)
-    mock_response.status_code = 200
-    mock_response.text = """<?xml version="1.0" encoding="utf-8"?>
-<feed xmlns="http://www.w3.org/2005/Atom"></feed>"""
-    mock_response.raise_for_status = Mock()
+    mock_response = httpx.Response(
+        200,
+        text="""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"></feed>""",
+        request=httpx.Request("GET", "https://export.arxiv.org/api/query"),
+    )
 
     repo = ArxivRepository.from_client(mock_client)
     mock_get = mocker.patch.object(repo.http, "get", return_value=mock_response)
@@ -226,10 +223,10 @@ async def test_fetch_handles_unexpected_parse_error(
     assert result is None
 
 
-async def test_fetch_enrichments_runs_in_batches(
+async def test_fetch_enrichments_processes_all_papers(
     mock_client: httpx.AsyncClient, mocker: MockerFixture
 ) -> None:
-    """fetch_enrichments がバッチ処理されても全件処理されること。"""
+    """fetch_enrichments がワーカーで処理されても全件処理されること。"""
     repo = ArxivRepository.from_client(mock_client)
 
     papers = [
@@ -250,3 +247,23 @@ async def test_fetch_enrichments_runs_in_batches(
 
     assert len(result) == 120
     assert mock_enrich.call_count == 120
+
+
+async def test_fetch_enrichments_deduplicates_dois(
+    mock_client: httpx.AsyncClient, mocker: MockerFixture
+) -> None:
+    """同一 DOI は 1 回だけ問い合わせ、DOI のない論文は問い合わせないこと。"""
+    repo = ArxivRepository.from_client(mock_client)
+
+    papers = [
+        Paper(title="title-a", authors=[], year=2024, venue="v", doi="10.1000/a"),
+        Paper(title="title-a-dup", authors=[], year=2024, venue="v", doi="10.1000/a"),
+        Paper(title="title-b", authors=[], year=2024, venue="v", doi="10.1000/b"),
+        Paper(title="no-doi", authors=[], year=2024, venue="v", doi=None),
+    ]
+
+    mock_enrich = mocker.patch.object(repo, "_fetch_single_paper_enrichment", return_value=None)
+
+    await repo.fetch_enrichments(papers)
+
+    assert [call.args[0].title for call in mock_enrich.call_args_list] == ["title-a", "title-b"]
@@ -8,12 +8,6 @@ from crawler.domain.enums import ConferenceName
 from crawler.infrastructure.repositories.dblp_repository import DBLPRepository
 
 
-@pytest.fixture
-def mock_client(mocker: MockerFixture) -> httpx.AsyncClient:
-    """Mock AsyncClient fixture."""
-    return mocker.AsyncMock(spec=httpx.AsyncClient)
-
-
 @pytest.fixture
 def mock_dblp_response_data() -> dict[str, Any]:
     return {
@@ -75,6 +69,31 @@ def test_parse_papers_valid(
     assert papers[1].doi is None
 
 
+def test_parse_papers_single_hit_dict(mock_client: httpx.AsyncClient) -> None:
+    """ヒットが 1 件で hit が辞書として返る場合もパースできること"""
+    repo = DBLPRepository.from_client(mock_client)
+    data = {
+        "result": {
+            "hits": {
+                "@total": "1",
+                "hit": {
+                    "info": {
+                        "title": "Single Paper",
+                        "authors": {"author": {"text": "Author A"}},
+                        "year": "2025",
+                        "venue": "RecSys",
+                    }
+                },
+            }
+        }
+    }
+    papers = repo._parse_papers(data)
+
+    assert len(papers) == 1
+    assert papers[0].title == "Single Paper"
+    assert papers[0].authors == ["Author A"]
+
+
 def test_parse_papers_no_hits(mock_client: httpx.AsyncClient) -> None:
     """ヒットなしの場合のパーステスト"""
     repo = DBLPRepository.from_client(mock_client)
@@ -109,6 +128,24 @@ def test_parse_authors(mock_client: httpx.AsyncClient) -> None:
     # 空辞書
     assert repo._parse_authors({}) == []
 
+    # 文字列以外の著者名は文字列化する
+    assert repo._parse_authors({"author": [{"text": 42}]}) == ["42"]
+    assert repo._parse_authors({"author": {"text": 42}}) == ["42"]
+
+
+async def test_setup_loads_robots_txt_only_once(mock_client: httpx.AsyncClient) -> None:
+    """setup を複数回呼んでも robots.txt の取得は一度だけであること"""
+    mock_client.get.return_value = httpx.Response(  # type: ignore[attr-defined]
+        404, request=httpx.Request("GET", "https://dblp.org/robots.txt")
+    )
+
+    repo = DBLPRepository.from_client(mock_client)
+    await repo.setup(mock_client)
+    await repo.setup(mock_client)
+
+    assert repo.robot_guard.loaded is True
+    assert mock_client.get.await_count == 1  # type: ignore[attr-defined]
+
 
 async def test_fetch_papers_integration_mock(
     mock_client: httpx.AsyncClient,
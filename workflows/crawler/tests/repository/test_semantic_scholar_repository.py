@@ -9,12 +9,6 @@ from crawler.infrastructure.repositories.semantic_scholar_repository import (
 )
 
 
-@pytest.fixture
-def mock_client(mocker: MockerFixture) -> httpx.AsyncClient:
-    """Mock AsyncClient fixture."""
-    return mocker.AsyncMock(spec=httpx.AsyncClient)
-
-
 def test_parse_single_paper(mock_client: httpx.AsyncClient) -> None:
     """単一の論文レスポンスから補完情報をパースできることをテスト"""
     repo = SemanticScholarRepository.from_client(mock_client)
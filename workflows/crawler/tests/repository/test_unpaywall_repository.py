@@ -9,12 +9,6 @@ from crawler.infrastructure.http.http_retry_client import HttpRetryClient
 from crawler.infrastructure.repositories.unpaywall_repository import UnpaywallRepository
 
 
-@pytest.fixture
-def mock_client(mocker: MockerFixture) -> httpx.AsyncClient:
-    """Mock AsyncClient fixture."""
-    return mocker.AsyncMock(spec=httpx.AsyncClient)
-
-
 @pytest.fixture
 def mock_unpaywall_response() -> dict[str, Any]:
     """Sample Unpaywall API response."""
@@ -57,6 +51,52 @@ class TestUnpaywallRepository:
         assert result.pdf_url == "https://example.com/paper.pdf"
         assert isinstance(result, PaperEnrichment)
 
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            (
+                {
+                    "doi": "10.1145/test",
+                    "best_oa_location": {"url_for_pdf": "https://example.com/best.pdf"},
+                    "oa_locations": [{"url_for_pdf": "https://example.com/other.pdf"}],
+                },
+                "https://example.com/best.pdf",
+            ),
+            (
+                {
+                    "doi": "10.1145/test",
+                    "best_oa_location": None,
+                    "oa_locations": [
+                        {"url_for_pdf": None},
+                        {"url_for_pdf": "https://example.com/other.pdf"},
+                    ],
+                },
+                "https://example.com/other.pdf",
+            ),
+            (
+                {"doi": "10.1145/test", "best_oa_location": None, "oa_locations": None},
+                None,
+            ),
+            (
+                {"doi": "10.1145/test", "oa_locations": [{"url_for_pdf": ""}]},
+                None,
+            ),
+        ],
+    )
+    async def test_parse_paper_pdf_url(
+        self,
+        mock_client: httpx.AsyncClient,
+        data: dict[str, Any],
+        expected: str | None,
+    ) -> None:
+        """best_oa_location を優先し、無ければ oa_locations から PDF URL を取得すること。"""
+        repo = UnpaywallRepository.from_client(mock_client)
+
+        result = repo._parse_paper(data)
+
+        assert result is not None
+        assert result.pdf_url == expected
+
     async def test_fetch_paper_not_found(
         self,
         mock_client: httpx.AsyncClient,
@@ -84,7 +124,7 @@ class TestUnpaywallRepository:
 
         assert result is None
         mock_logger.assert_called_with(
-            "No paper found for DOI 10.1145/notfound on Unpaywall (404)."
+            "No paper found for DOI {doi} on Unpaywall (404).", doi="10.1145/notfound"
         )
 
     async def test_fetch_paper_http_error(
@@ -179,12 +219,12 @@ class TestUnpaywallRepository:
         # headers は渡さない
         assert "headers" not in call_args[1]
 
-    async def test_fetch_enrichments_runs_in_batches(
+    async def test_fetch_enrichments_processes_all_papers(
         self,
         mock_client: httpx.AsyncClient,
         mocker: MockerFixture,
     ) -> None:
-        """fetch_enrichments がバッチ処理でも DOI あり論文を全件処理すること。"""
+        """fetch_enrichments がワーカーで処理されても DOI あり論文を全件処理すること。"""
         repo = UnpaywallRepository.from_client(mock_client)
 
         papers = [
@@ -207,3 +247,27 @@ class TestUnpaywallRepository:
         assert len(result) == 120
         # DOI あり 120 件のみ対象
         assert mock_enrich.call_count == 120
+
+    async def test_fetch_enrichments_deduplicates_dois(
+        self,
+        mock_client: httpx.AsyncClient,
+        mocker: MockerFixture,
+    ) -> None:
+        """同一 DOI は 1 回だけ問い合わせ、DOI のない論文は問い合わせないこと。"""
+        repo = UnpaywallRepository.from_client(mock_client)
+
+        papers = [
+            Paper(title="title-a", authors=[], year=2024, venue="v", doi="10.1000/a"),
+            Paper(title="title-a-dup", authors=[], year=2024, venue="v", doi="10.1000/a"),
+            Paper(title="title-b", authors=[], year=2024, venue="v", doi="10.1000/b"),
+            Paper(title="no-doi", authors=[], year=2024, venue="v", doi=None),
+        ]
+
+        mock_enrich = mocker.patch.object(repo, "_fetch_single_paper_enrichment", return_value=None)
+
+        await repo.fetch_enrichments(papers)
+
+        assert [call.args[0].title for call in mock_enrich.call_args_list] == [
+            "title-a",
+            "title-b",
+        ]
@@ -111,7 +111,8 @@ async def test_execute_flow(
     expected_papers_for_enrich = [initial_papers[0]]
     mock_semantic_scholar_repo.fetch_enrichments.assert_called_once_with(expected_papers_for_enrich)
     mock_unpaywall_repo.fetch_enrichments.assert_called_once_with(expected_papers_for_enrich)
-    mock_arxiv_repo.fetch_enrichments.assert_called_once_with(expected_papers_for_enrich)
+    # S2 と Unpaywall で要約と PDF URL が揃うため、arXiv には問い合わせない
+    mock_arxiv_repo.fetch_enrichments.assert_not_called()
 
     # 5. Datalake save_papers（最終的なenrich済み論文が保存されること）
     mock_datalake.save_papers.assert_called_once_with(
@@ -214,3 +215,69 @@ async def test_apply_enrichments_can_overwrite_existing_values(
     await usecase.execute(2024)
 
     assert paper.abstract == "Updated abstract"
+
+
+@pytest.mark.asyncio
+async def test_execute_skips_fully_enriched_papers(
+    mock_dblp_repo: MagicMock,
+    mock_semantic_scholar_repo: MagicMock,
+    mock_datalake: MagicMock,
+) -> None:
+    """上書きしない場合、要約と PDF URL が揃った論文は補完対象から除外されること"""
+    complete = Paper(
+        title="P1",
+        authors=[],
+        year=2024,
+        venue="RecSys",
+        doi="10.1145/1",
+        abstract="abstract",
+        pdf_url="https://example.com/p1.pdf",
+    )
+    missing_pdf = Paper(
+        title="P2", authors=[], year=2024, venue="RecSys", doi="10.1145/2", abstract="abstract"
+    )
+    mock_dblp_repo.fetch_papers.return_value = [complete, missing_pdf]
+    mock_semantic_scholar_repo.fetch_enrichments.return_value = []
+
+    usecase = CrawlConferencePapers(
+        conf_name=ConferenceName.RECSYS,
+        paper_retriever=mock_dblp_repo,
+        paper_enrichers=[mock_semantic_scholar_repo],
+        paper_datalake=mock_datalake,
+    )
+
+    await usecase.execute(2024)
+
+    mock_semantic_scholar_repo.fetch_enrichments.assert_called_once_with([missing_pdf])
+
+
+@pytest.mark.asyncio
+async def test_execute_enriches_all_papers_when_overwriting(
+    mock_dblp_repo: MagicMock,
+    mock_semantic_scholar_repo: MagicMock,
+    mock_datalake: MagicMock,
+) -> None:
+    """上書きする場合は補完済みの論文も補完対象とすること"""
+    complete = Paper(
+        title="P1",
+        authors=[],
+        year=2024,
+        venue="RecSys",
+        doi="10.1145/1",
+        abstract="abstract",
+        pdf_url="https://example.com/p1.pdf",
+    )
+    mock_dblp_repo.fetch_papers.return_value = [complete]
+    mock_semantic_scholar_repo.fetch_enrichments.return_value = []
+
+    usecase = CrawlConferencePapers(
+        conf_name=ConferenceName.RECSYS,
+        paper_retriever=mock_dblp_repo,
+        paper_enrichers=[mock_semantic_scholar_repo],
+        paper_datalake=mock_datalake,
+        overwrite_enrichments=True,
+    )
+
+    await usecase.execute(2024)
+
+    mock_semantic_scholar_repo.fetch_enrichments.assert_called_once_with([complete])
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from crawler.utils.concurrency import run_bounded
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_preserves_input_order() -> None:
+    """完了順に関わらず、入力と同じ順序で結果を返すこと"""
+
+    async def double(x: int) -> int:
+        # 後の要素ほど早く完了させる
+        await asyncio.sleep((5 - x) * 0.001)
+        return x * 2
+
+    results = await run_bounded(double, range(5), concurrency=3)
+
+    assert results == [0, 2, 4, 6, 8]
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_limits_concurrency() -> None:
+    """同時実行数が concurrency を超えないこと"""
+    running = 0
+    max_running = 0
+
+    async def track(_: int) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+    await run_bounded(track, range(20), concurrency=4)
+
+    assert max_running == 4
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_empty_items() -> None:
+    """要素が空の場合は空リストを返すこと"""
+
+    async def identity(x: int) -> int:
+        return x
+
+    assert await run_bounded(identity, [], concurrency=5) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", [0, -1])
+async def test_run_bounded_rejects_non_positive_concurrency(concurrency: int) -> None:
+    """concurrency が 1 未満の場合は ValueError を送出すること"""
+
+    async def identity(x: int) -> int:
+        return x
+
+    with pytest.raises(ValueError):
+        await run_bounded(identity, [1, 2], concurrency=concurrency)
@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from typing import NoReturn
 
 import httpx
@@ -5,6 +7,7 @@ import pytest
 from pytest_mock import MockerFixture
 
 from crawler.infrastructure.http.http_retry_client import HttpRetryClient
+from crawler.infrastructure.http.http_utils import MAX_RETRY_AFTER_SECONDS, parse_retry_after
 
 # ---------------------------------------------------------------------------
 # POST – 成功 / リトライ / 上限超過
@@ -383,3 +386,61 @@ async def test_retry_after_header_honored_for_non_429_retry_status(mocker: Mocke
 
     assert response.status_code == 200
     mock_sleep.assert_awaited_once_with(30.0)
+
+
+@pytest.mark.asyncio
+async def test_retry_after_http_date_header_compliance(mocker: MockerFixture) -> None:
+    """Retry-After ヘッダーが HTTP-date 形式の場合、その日時までの秒数で sleep すること。"""
+    mock_sleep = mocker.patch("asyncio.sleep", new_callable=mocker.AsyncMock)
+    mock_client = mocker.AsyncMock(spec=httpx.AsyncClient)
+
+    retry_at = datetime.now(tz=timezone.utc) + timedelta(seconds=30)
+    resp_429 = mocker.MagicMock(spec=httpx.Response)
+    resp_429.status_code = 429
+    resp_429.url = "http://test.com"
+    resp_429.headers = httpx.Headers({"Retry-After": format_datetime(retry_at, usegmt=True)})
+
+    resp_200 = mocker.MagicMock(spec=httpx.Response)
+    resp_200.status_code = 200
+
+    mock_client.post.side_effect = [resp_429, resp_200]
+
+    http = HttpRetryClient(mock_client)
+    response = await http.post("http://test.com", params={}, json={})
+
+    assert response.status_code == 200
+    call_args = mock_sleep.await_args
+    assert call_args
+    wait_time = call_args[0][0]
+    # HTTP-date は秒精度のため、切り捨て分と実行時間を許容する
+    assert 25.0 <= wait_time <= 30.0
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("15", 15.0),
+        ("300", 300.0),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+        ("Fri, 01 Jan 2100 00:00:00 GMT", MAX_RETRY_AFTER_SECONDS),
+        ("1e9", MAX_RETRY_AFTER_SECONDS),
+        ("-5", 0.0),
+        ("inf", None),
+        ("nan", None),
+        ("invalid", None),
+    ],
+)
+def test_parse_retry_after(value: str, expected: float | None) -> None:
+    """秒数形式・HTTP-date を上下限に丸めて解釈し、不正値・非有限値は None を返すこと。"""
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_warns_when_capped(mocker: MockerFixture) -> None:
+    """上限で待機秒数を切り詰めた場合のみ WARNING を出力すること。"""
+    mock_warning = mocker.patch("crawler.infrastructure.http.http_utils.logger.warning")
+
+    assert parse_retry_after("300") == 300.0
+    mock_warning.assert_not_called()
+
+    assert parse_retry_after("1e9") == MAX_RETRY_AFTER_SECONDS
+    mock_warning.assert_called_once()